@@ -44,13 +44,13 @@ async function verifyLLM() {
     });
     const duration = Date.now() - start;
     
-    console.log(`✅ Success (${duration}ms)`);
-    console.log(`Response: "${completion.choices[0].message.content}"`);
+    console.log(`✅ LLM success (${duration}ms)`);
+    console.log(`LLM response: "${completion.choices[0].message.content}"`);
     return true;
   } catch (error: any) {
-    console.error('❌ Failed');
-    console.error(`Error: ${error.message}`);
-    if (error.cause) console.error(`Cause: ${error.cause}`);
+    console.error('❌ LLM failed');
+    console.error(`LLM error: ${error.message}`);
+    if (error.cause) console.error(`LLM cause: ${error.cause}`);
     return false;
   }
 }
@@ -74,18 +74,18 @@ async function verifyTTS() {
     const buffer = Buffer.from(await response.arrayBuffer());
     const duration = Date.now() - start;
 
-    console.log(`✅ Success (${duration}ms)`);
-    console.log(`Received ${buffer.length} bytes of audio`);
+    console.log(`✅ TTS success (${duration}ms)`);
+    console.log(`TTS received ${buffer.length} bytes of audio`);
     
     // Optional: Save to temp file to verify
     const outputPath = path.join(__dirname, 'test_output_tts.mp3');
     fs.writeFileSync(outputPath, buffer);
-    console.log(`Saved output to ${outputPath}`);
+    console.log(`TTS saved output to ${outputPath}`);
     
     return true;
   } catch (error: any) {
-    console.error('❌ Failed');
-    console.error(`Error: ${error.message}`);
+    console.error('❌ TTS failed');
+    console.error(`TTS error: ${error.message}`);
     return false;
   }
 }
@@ -114,12 +114,12 @@ async function verifySTT() {
     });
     const duration = Date.now() - start;
 
-    console.log(`✅ Success (${duration}ms)`);
-    console.log(`Transcription: "${transcription.text}"`);
+    console.log(`✅ STT success (${duration}ms)`);
+    console.log(`STT transcription: "${transcription.text}"`);
     return true;
   } catch (error: any) {
-    console.error('❌ Failed');
-    console.error(`Error: ${error.message}`);
+    console.error('❌ STT failed');
+    console.error(`STT error: ${error.message}`);
     return false;
   }
 }
@@ -127,9 +127,9 @@ async function verifySTT() {
 async function main() {
   console.log('Starting Local Stack Verification...');
   
-  const llmOk = await verifyLLM();
-  const ttsOk = await verifyTTS();
-  const sttOk = await verifySTT();
+  // The three services are independent, so probe them concurrently:
+  // total wait is the slowest check rather than the sum of all three.
+  const [llmOk, ttsOk, sttOk] = await Promise.all([verifyLLM(), verifyTTS(), verifySTT()]);
 
   console.log('\n--- Summary ---');
   console.log(`LLM: ${llmOk ? '✅' : '❌'}`);